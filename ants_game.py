@@ -1,12 +1,20 @@
 import pygame
+import numpy as np
 import sys
 import math
 import random
+from bisect import bisect_left
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Deque
 from abc import ABC, abstractmethod
-import time
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; fall back to vectorized NumPy
+    NUMBA_AVAILABLE = False
 
 class GameState(Enum):
     MENU = "menu"
@@ -14,7 +22,7 @@ class GameState(Enum):
     PAUSED = "paused"
     GAME_OVER = "game_over"
 
-@dataclass
+@dataclass(frozen=True)
 class GameConfig:
     SCREEN_WIDTH: int = 800
     SCREEN_HEIGHT: int = 600
@@ -24,6 +32,36 @@ class GameConfig:
     MIN_GROUND_HEIGHT: int = 100
     MAX_GROUND_HEIGHT: int = 200
     DESTRUCTION_FADE_SPEED: int = 5
+    MAX_FRAME_TIME: float = 0.1  # Longest delta time a single update may simulate
+
+if NUMBA_AVAILABLE:
+    # Explicit signature so Numba compiles at import time rather than on the first gameplay frame
+    @njit("void(f8[::1], f8[::1], f8[::1], f8[::1], b1[::1], f8, i4[::1], i8)", cache=True)
+    def _step(x, y, vx, vy, alive, gravity, ground_heights, screen_height):
+        """Integrates one physics step in place for every live ant and resolves ground collision"""
+        for i in range(len(x)):
+            if not alive[i]:
+                continue
+            x[i] += vx[i]
+            y[i] += vy[i]
+            
+            ground = screen_height - ground_heights[i]
+            if y[i] > ground:
+                y[i] = ground
+                vy[i] = 0.0
+            else:
+                vy[i] += gravity
+else:
+    # A per-element loop is slow in plain Python, so step every ant with whole-array operations
+    def _step(x, y, vx, vy, alive, gravity, ground_heights, screen_height):
+        """Integrates one physics step in place for every live ant and resolves ground collision"""
+        x += np.where(alive, vx, 0.0)
+        y += np.where(alive, vy, 0.0)
+        
+        ground = screen_height - ground_heights
+        hit = alive & (y > ground)
+        y[:] = np.where(hit, ground, y)
+        vy[:] = np.where(hit, 0.0, np.where(alive, vy + gravity, vy))
 
 class Colors:
     WHITE = (255, 255, 255)
@@ -35,48 +73,61 @@ class Colors:
     YELLOW = (255, 255, 0)
 
 class Ability(ABC):
-    def __init__(self, cooldown: float):
+    def __init__(self, cooldown: float, range: float,
+                 cooldowns: Optional[np.ndarray] = None, index: int = 0):
         self.cooldown = cooldown
-        self.current_cooldown = 0
+        self.range = range
+        self._range2 = range * range
+        # Remaining cooldown lives in a slot of an array the owner can tick in bulk
+        self._cooldowns = cooldowns if cooldowns is not None else np.zeros(1, dtype=np.float32)
+        self._index = index
+
+    @property
+    def current_cooldown(self) -> float:
+        return self._cooldowns[self._index]
+
+    @current_cooldown.setter
+    def current_cooldown(self, value: float):
+        self._cooldowns[self._index] = value
 
     @abstractmethod
-    def activate(self, user, target) -> bool:
+    def activate(self, user, target, d2: Optional[float] = None) -> bool:
         pass
 
-    def update(self, dt: float):
-        if self.current_cooldown > 0:
-            self.current_cooldown -= dt
+    def in_range(self, user, target, d2: Optional[float] = None) -> bool:
+        """Checks range against a squared distance, reusing d2 when the caller already has it"""
+        if d2 is None:
+            dx = user.x - target.x
+            dy = user.y - target.y
+            d2 = dx * dx + dy * dy
+        return d2 <= self._range2
 
 class BiteAbility(Ability):
-    def __init__(self):
-        super().__init__(cooldown=2.0)
+    def __init__(self, cooldowns: Optional[np.ndarray] = None, index: int = 0):
+        super().__init__(2.0, 30, cooldowns, index)
         self.damage = 20
-        self.range = 30
 
-    def activate(self, user, target) -> bool:
+    def activate(self, user, target, d2: Optional[float] = None) -> bool:
         if self.current_cooldown > 0:
             return False
         
-        distance = math.hypot(user.x - target.x, user.y - target.y)
-        if distance <= self.range:
+        if self.in_range(user, target, d2):
             target.take_damage(self.damage)
             self.current_cooldown = self.cooldown
             return True
         return False
 
 class AcidSprayAbility(Ability):
-    def __init__(self):
-        super().__init__(cooldown=5.0)
+    def __init__(self, cooldowns: Optional[np.ndarray] = None, index: int = 0):
+        super().__init__(5.0, 50, cooldowns, index)
         self.damage = 15
-        self.range = 50
         self.area_effect = 20
 
-    def activate(self, user, target) -> bool:
+    def activate(self, user, target, d2: Optional[float] = None) -> bool:
         if self.current_cooldown > 0:
             return False
             
-        distance = math.hypot(user.x - target.x, user.y - target.y)
-        if distance <= self.range:
+        if self.in_range(user, target, d2):
             target.take_damage(self.damage)
             target.apply_effect("acid", duration=3.0)
             self.current_cooldown = self.cooldown
@@ -104,69 +155,93 @@ class AcidEffect(StatusEffect):
 class Terrain:
     def __init__(self, config: GameConfig):
         self.config = config
-        self.surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
+        # Opaque background with the sky baked in, so drawing a frame starts with one plain blit.
+        # Surfaces are converted to the display format up front so blits skip per-pixel conversion.
+        self.surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)).convert()
+        self._xs = np.arange(0, config.SCREEN_WIDTH, config.TERRAIN_RESOLUTION, dtype=np.int32)
         self.height_map = self.generate_terrain()
-        self.destruction_map = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
+        # Texture detail is rolled once so repaints don't re-randomize it. Dots are stored as
+        # sorted height map indices so they follow the surface as it is destroyed.
+        self.texture_dots = [i for i in range(len(self.height_map)) if random.random() < 0.1]
+        self.destruction_map = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT),
+                                              pygame.SRCALPHA).convert_alpha()
         self.render_terrain()
+        
+        # Areas repainted since the game last copied them to the screen
+        self.dirty_rects: List[pygame.Rect] = []
 
-    def generate_terrain(self) -> List[int]:
+    def generate_terrain(self) -> np.ndarray:
         """Generates terrain using Perlin-like noise"""
-        heights = []
         phase = random.uniform(0, math.pi * 2)
+        xs = self._xs.astype(np.float32)
         
         # Combine multiple sine waves for more natural-looking terrain
-        for x in range(0, self.config.SCREEN_WIDTH, self.config.TERRAIN_RESOLUTION):
-            height = self.config.MIN_GROUND_HEIGHT
-            height += math.sin(x * 0.02 + phase) * 30
-            height += math.sin(x * 0.05 + phase * 2) * 15
-            height += math.sin(x * 0.01 + phase * 0.5) * 45
-            height = min(max(height, self.config.MIN_GROUND_HEIGHT), self.config.MAX_GROUND_HEIGHT)
-            heights.append(int(height))
-        return heights
-
-    def render_terrain(self):
-        """Renders the terrain to the surface"""
-        self.surface.fill((0, 0, 0, 0))
-        
-        # Create terrain polygon
-        points = [(0, self.config.SCREEN_HEIGHT)]
-        for x, height in enumerate(self.height_map):
-            x = x * self.config.TERRAIN_RESOLUTION
-            y = self.config.SCREEN_HEIGHT - height
+        heights = self.config.MIN_GROUND_HEIGHT + np.sin(xs * 0.02 + phase) * 30
+        heights += np.sin(xs * 0.05 + phase * 2) * 15
+        heights += np.sin(xs * 0.01 + phase * 0.5) * 45
+        np.clip(heights, self.config.MIN_GROUND_HEIGHT, self.config.MAX_GROUND_HEIGHT, out=heights)
+        return heights.astype(np.int32)
+
+    def render_terrain(self, area: Optional[pygame.Rect] = None):
+        """Renders the terrain to the surface, optionally only within a dirty area"""
+        if area is None:
+            area = self.surface.get_rect()
+        self.surface.set_clip(area)
+        self.surface.fill(Colors.WHITE, area)
+        
+        res = self.config.TERRAIN_RESOLUTION
+        screen_height = self.config.SCREEN_HEIGHT
+        height_map = self.height_map
+        
+        # Create terrain polygon for the segments covering the area
+        start = max(0, area.left // res - 1)
+        end = min(len(height_map), area.right // res + 2)
+        points = [(start * res, screen_height)]
+        for i in range(start, end):
+            x = i * res
+            y = screen_height - int(height_map[i])
             points.append((x, y))
-        points.append((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        right = self.config.SCREEN_WIDTH if end == len(height_map) else (end - 1) * res
+        points.append((right, screen_height))
         
         # Draw terrain with gradient
         pygame.draw.polygon(self.surface, Colors.GREEN, points)
         
-        # Add texture/detail
-        for i in range(len(points) - 2):
-            x = points[i][0]
-            y = points[i][1]
-            if random.random() < 0.1:  # 10% chance for each segment
-                pygame.draw.circle(self.surface, (0, 200, 0), (int(x), int(y)), 2)
+        # Add texture/detail for the dots inside the repainted segments
+        dots = self.texture_dots
+        for k in range(bisect_left(dots, start), bisect_left(dots, end)):
+            i = dots[k]
+            x = i * res
+            y = screen_height - int(height_map[i])
+            pygame.draw.circle(self.surface, (0, 200, 0), (x, y), 2)
+        
+        self.surface.set_clip(None)
 
     def apply_destruction(self, x: int, y: int, radius: int):
         """Applies destruction effect at the given point"""
         # Create destruction circle
         pygame.draw.circle(self.destruction_map, (0, 0, 0, 255), (x, y), radius)
         
+        res = self.config.TERRAIN_RESOLUTION
+        
         # Update height map around the impact
-        impact_start = max(0, x // self.config.TERRAIN_RESOLUTION - radius // self.config.TERRAIN_RESOLUTION)
-        impact_end = min(len(self.height_map),
-                        (x + radius) // self.config.TERRAIN_RESOLUTION + 1)
+        impact_start = max(0, x // res - radius // res)
+        impact_end = min(len(self.height_map), (x + radius) // res + 1)
         
-        for i in range(impact_start, impact_end):
-            dist = abs(x - i * self.config.TERRAIN_RESOLUTION)
-            if dist < radius:
-                height_reduction = int((radius - dist) * 0.5)
-                self.height_map[i] = max(self.config.MIN_GROUND_HEIGHT,
-                                       self.height_map[i] - height_reduction)
+        dist = np.abs(self._xs[impact_start:impact_end] - x)
+        height_reduction = ((radius - dist) * 0.5).clip(min=0).astype(np.int32)
+        self.height_map[impact_start:impact_end] = np.maximum(
+            self.config.MIN_GROUND_HEIGHT,
+            self.height_map[impact_start:impact_end] - height_reduction)
         
-        self.render_terrain()
+        # Only repaint the vertical band touched by the impact
+        area = pygame.Rect(x - radius, 0, radius * 2, self.config.SCREEN_HEIGHT).clip(self.surface.get_rect())
+        self.render_terrain(area)
+        self.dirty_rects.append(area)
 
     def get_height_at(self, x: int) -> int:
         """Returns the terrain height at the given x coordinate"""
+        # Kept as public API for single lookups; the game loop uses get_heights_at
         if x < 0 or x >= self.config.SCREEN_WIDTH:
             return self.config.MIN_GROUND_HEIGHT
             
@@ -174,62 +249,139 @@ class Terrain:
         index = min(len(self.height_map) - 1, index)
         return self.height_map[index]
 
+    def get_heights_at(self, xs: np.ndarray) -> np.ndarray:
+        """Returns the terrain heights for an array of x coordinates in one lookup"""
+        xs = np.asarray(xs, dtype=np.int32)
+        index = np.clip(xs // self.config.TERRAIN_RESOLUTION, 0, len(self.height_map) - 1)
+        heights = self.height_map[index]
+        return np.where((xs < 0) | (xs >= self.config.SCREEN_WIDTH),
+                        np.int32(self.config.MIN_GROUND_HEIGHT), heights)
+
     def check_collision(self, x: int, y: int) -> bool:
         """Checks if a point collides with the terrain"""
-        if x < 0 or x >= self.config.SCREEN_WIDTH or y < 0 or y >= self.config.SCREEN_HEIGHT:
+        config = self.config
+        screen_height = config.SCREEN_HEIGHT
+        # Terrain never rises above MAX_GROUND_HEIGHT, so anything higher is airborne
+        if y < screen_height - config.MAX_GROUND_HEIGHT:
+            return False
+        if x < 0 or x >= config.SCREEN_WIDTH or y >= screen_height:
             return False
             
-        terrain_height = self.config.SCREEN_HEIGHT - self.get_height_at(x)
+        height_map = self.height_map
+        terrain_height = screen_height - height_map[min(len(height_map) - 1, x // config.TERRAIN_RESOLUTION)]
         return y >= terrain_height
 
 class Projectile:
-    def __init__(self, x: float, y: float, velocity: List[float], damage: int = 30):
+    def __init__(self, x: float, y: float, vx: float, vy: float, damage: int = 30):
         self.x = x
         self.y = y
-        self.velocity = velocity
+        self.vx = vx
+        self.vy = vy
         self.damage = damage
         self.active = True
-        self.trail: List[Tuple[float, float]] = []
         self.trail_length = 10
+        self.trail: Deque[Tuple[float, float]] = deque(maxlen=self.trail_length)
 
     def update(self, config: GameConfig):
         """Updates projectile position and trail"""
-        # Add current position to trail
+        # Add current position to trail (oldest point drops off automatically)
         self.trail.append((self.x, self.y))
-        if len(self.trail) > self.trail_length:
-            self.trail.pop(0)
 
         # Update position
-        self.velocity[1] += config.GRAVITY
-        self.x += self.velocity[0]
-        self.y += self.velocity[1]
+        self.vy += config.GRAVITY
+        self.x += self.vx
+        self.y += self.vy
 
-    def draw(self, screen: pygame.Surface):
-        """Draws the projectile and its trail"""
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """Draws the projectile and its trail, returning the area touched"""
         if not self.active:
-            return
+            return None
 
-        # Draw trail
+        # Draw trail as a single polyline
+        trail_rect = None
         if len(self.trail) > 1:
-            for i in range(len(self.trail) - 1):
-                alpha = int(255 * (i / len(self.trail)))
-                pygame.draw.line(screen, (*Colors.YELLOW, alpha),
-                               (int(self.trail[i][0]), int(self.trail[i][1])),
-                               (int(self.trail[i+1][0]), int(self.trail[i+1][1])), 2)
+            points = [(int(x), int(y)) for x, y in self.trail]
+            trail_rect = pygame.draw.lines(screen, Colors.YELLOW, False, points, 2)
 
         # Draw projectile
-        pygame.draw.circle(screen, Colors.RED, (int(self.x), int(self.y)), 4)
+        rect = pygame.draw.circle(screen, Colors.RED, (int(self.x), int(self.y)), 4)
+        if trail_rect is not None:
+            rect.union_ip(trail_rect)
+        return rect
+
+# Leg and antenna swing angles only depend on the animation frame and limb index
+ANIMATION_FRAMES = 4
+LEG_ANGLES = [[math.sin(f * 0.5 + i) * 0.3 for i in range(3)] for f in range(ANIMATION_FRAMES)]
+LEG_COS = [[math.cos(a) for a in row] for row in LEG_ANGLES]
+LEG_SIN = [[math.sin(a) for a in row] for row in LEG_ANGLES]
+ANTENNA_ANGLES = [[math.sin(f * 0.2 + i) * 0.3 for i in range(2)] for f in range(ANIMATION_FRAMES)]
+ANTENNA_COS = [[math.cos(a) for a in row] for row in ANTENNA_ANGLES]
+ANTENNA_SIN = [[math.sin(a) for a in row] for row in ANTENNA_ANGLES]
+
+class AntPool:
+    """Structure-of-arrays storage for the numeric state of every ant"""
+    FIELDS = ('x', 'y', 'vx', 'vy', 'health', 'alive')
+
+    def __init__(self, capacity: int = 8):
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        # Set whenever an ant's liveness flips, so owners only rebuild alive lists when needed
+        self.alive_changed = False
+
+    def add(self, x: float, y: float, health: float) -> int:
+        """Allocates a slot for a new ant and returns its index"""
+        if self.count == len(self.x):
+            self._grow()
+        index = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.vx[index] = 0.0
+        self.vy[index] = 0.0
+        self.health[index] = health
+        self.alive[index] = True
+        self.count += 1
+        return index
+
+    def _grow(self):
+        """Doubles the capacity of every field array"""
+        capacity = max(1, len(self.x) * 2)
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def step(self, terrain: Terrain):
+        """Moves every live ant, applies gravity and resolves ground collision in one pass"""
+        n = self.count
+        x, vx = self.x[:n], self.vx[:n]
+        ground_heights = terrain.get_heights_at(x + vx)
+        _step(x, self.y[:n], vx, self.vy[:n], self.alive[:n],
+              terrain.config.GRAVITY, ground_heights, terrain.config.SCREEN_HEIGHT)
 
 class Ant:
-    def __init__(self, x: float, y: float, color: Tuple[int, int, int] = Colors.BLACK, is_ai: bool = False):
-        self.x = x
-        self.y = y
+    # Body, legs, antennae and eyes are baked into per-color animation frames
+    SPRITE_SIZE = (40, 24)
+    SPRITE_ORIGIN = (20, 12)
+    _sprite_cache: Dict[Tuple[Tuple[int, int, int], Tuple[int, int, int]], List[pygame.Surface]] = {}
+
+    __slots__ = ('pool', 'index', 'color', 'max_health', 'is_ai', 'direction',
+                 'walking', 'animation_frame', 'animation_timer',
+                 '_cooldowns', 'bite', 'acid', '_ability_list', 'abilities', 'active_effects')
+
+    def __init__(self, x: float, y: float, color: Tuple[int, int, int] = Colors.BLACK, is_ai: bool = False,
+                 pool: Optional[AntPool] = None):
+        # Position, velocity, health and liveness live in a shared pool for bulk updates
+        self.pool = pool if pool is not None else AntPool(1)
+        self.index = self.pool.add(x, y, health=100)
         self.color = color
-        self.health = 100
         self.max_health = 100
-        self.is_alive = True
         self.is_ai = is_ai
-        self.velocity = [0, 0]
         self.direction = 1  # 1 for right, -1 for left
         
         # Animation states
@@ -237,35 +389,73 @@ class Ant:
         self.animation_frame = 0
         self.animation_timer = 0
         
-        # Abilities
+        # Abilities share one cooldown array so they can be ticked together
+        self._cooldowns = np.zeros(2, dtype=np.float32)
+        self.bite = BiteAbility(self._cooldowns, 0)
+        self.acid = AcidSprayAbility(self._cooldowns, 1)
+        self._ability_list: Tuple[Ability, ...] = (self.bite, self.acid)
         self.abilities: Dict[str, Ability] = {
-            'bite': BiteAbility(),
-            'acid_spray': AcidSprayAbility()
+            'bite': self.bite,
+            'acid_spray': self.acid
         }
         
         # Status effects
         self.active_effects: List[StatusEffect] = []
 
-    def update(self, dt: float, terrain: Terrain):
-        """Updates ant state"""
-        if not self.is_alive:
-            return
+    @property
+    def x(self) -> float:
+        return self.pool.x[self.index]
 
-        # Update position and apply gravity
-        self.x += self.velocity[0]
-        self.y += self.velocity[1]
-        
-        # Ground collision
-        ground_height = terrain.get_height_at(int(self.x))
-        if self.y > terrain.config.SCREEN_HEIGHT - ground_height:
-            self.y = terrain.config.SCREEN_HEIGHT - ground_height
-            self.velocity[1] = 0
-        else:
-            self.velocity[1] += terrain.config.GRAVITY
+    @x.setter
+    def x(self, value: float):
+        self.pool.x[self.index] = value
+
+    @property
+    def y(self) -> float:
+        return self.pool.y[self.index]
+
+    @y.setter
+    def y(self, value: float):
+        self.pool.y[self.index] = value
+
+    @property
+    def vx(self) -> float:
+        return self.pool.vx[self.index]
+
+    @vx.setter
+    def vx(self, value: float):
+        self.pool.vx[self.index] = value
 
-        # Update abilities
-        for ability in self.abilities.values():
-            ability.update(dt)
+    @property
+    def vy(self) -> float:
+        return self.pool.vy[self.index]
+
+    @vy.setter
+    def vy(self, value: float):
+        self.pool.vy[self.index] = value
+
+    @property
+    def health(self) -> float:
+        return self.pool.health[self.index]
+
+    @health.setter
+    def health(self, value: float):
+        self.pool.health[self.index] = value
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(self.pool.alive[self.index])
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        self.pool.alive[self.index] = value
+        self.pool.alive_changed = True
+
+    def update(self, dt: float):
+        """Updates ant state; movement and gravity are stepped in bulk by AntPool.step"""
+        # Update ability cooldowns
+        self._cooldowns -= dt
+        np.maximum(self._cooldowns, 0, out=self._cooldowns)
 
         # Update status effects
         self.active_effects = [effect for effect in self.active_effects 
@@ -276,129 +466,147 @@ class Ant:
             self.animation_timer += dt
             if self.animation_timer >= 0.1:  # Animation frame rate
                 self.animation_timer = 0
-                self.animation_frame = (self.animation_frame + 1) % 4
+                self.animation_frame = (self.animation_frame + 1) % ANIMATION_FRAMES
 
-    def draw(self, screen: pygame.Surface):
-        """Draws the ant with animations and effects"""
-        if not self.is_alive:
-            return
-
-        # Draw ant body
-        body_points = self.get_body_points()
-        pygame.draw.polygon(screen, self.color, body_points)
-        
-        # Draw legs with animation
-        self.draw_legs(screen)
-        
-        # Draw antennae
-        self.draw_antennae(screen)
-        
-        # Draw eyes
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """Draws the ant with animations and effects, returning the area touched"""
+        # Draw pre-rendered body, legs, antennae and eyes
         eye_color = Colors.RED if any(isinstance(effect, AcidEffect) 
                                     for effect in self.active_effects) else Colors.WHITE
-        self.draw_eyes(screen, eye_color)
+        frames = self._build_sprites(self.color, eye_color)
+        rect = screen.blit(frames[self.animation_frame],
+                           (int(self.x) - self.SPRITE_ORIGIN[0], int(self.y) - self.SPRITE_ORIGIN[1]))
         
         # Draw health bar
-        self.draw_health_bar(screen)
+        rect.union_ip(self.draw_health_bar(screen))
         
         # Draw ability cooldowns
-        self.draw_ability_cooldowns(screen)
-
-    def get_body_points(self) -> List[Tuple[int, int]]:
+        rect.union_ip(self.draw_ability_cooldowns(screen))
+        return rect
+
+    @classmethod
+    def _build_sprites(cls, color: Tuple[int, int, int],
+                       eye_color: Tuple[int, int, int]) -> List[pygame.Surface]:
+        """Returns the cached animation frames for an ant color, rendering them on first use"""
+        key = (color, eye_color)
+        frames = cls._sprite_cache.get(key)
+        if frames is None:
+            cx, cy = cls.SPRITE_ORIGIN
+            frames = []
+            for frame in range(ANIMATION_FRAMES):
+                surface = pygame.Surface(cls.SPRITE_SIZE, pygame.SRCALPHA).convert_alpha()
+                pygame.draw.polygon(surface, color, cls.get_body_points(cx, cy))
+                cls.draw_legs(surface, cx, cy, color, frame)
+                cls.draw_antennae(surface, cx, cy, color, frame)
+                cls.draw_eyes(surface, cx, cy, eye_color)
+                frames.append(surface)
+            cls._sprite_cache[key] = frames
+        return frames
+
+    @staticmethod
+    def get_body_points(x: float, y: float) -> List[Tuple[int, int]]:
         """Returns points for drawing ant body"""
         width = 20
         height = 10
         
         points = [
-            (self.x - width//2, self.y - height//2),
-            (self.x + width//2, self.y - height//2),
-            (self.x + width//2, self.y + height//2),
-            (self.x - width//2, self.y + height//2)
+            (x - width//2, y - height//2),
+            (x + width//2, y - height//2),
+            (x + width//2, y + height//2),
+            (x - width//2, y + height//2)
         ]
         
         return points
 
-    def draw_legs(self, screen: pygame.Surface):
+    @staticmethod
+    def draw_legs(surface: pygame.Surface, x: float, y: float,
+                  color: Tuple[int, int, int], animation_frame: int):
         """Draws ant legs with walking animation"""
         leg_pairs = 3
         leg_length = 8
         body_width = 20
         
         for i in range(leg_pairs):
-            # Calculate leg positions with animation
-            angle_offset = math.sin(self.animation_frame * 0.5 + i) * 0.3
+            # Look up leg swing for this animation frame
+            cos_offset = LEG_COS[animation_frame][i]
+            sin_offset = LEG_SIN[animation_frame][i]
             
             # Left leg
-            start_x = self.x - body_width//2 + (i * body_width//(leg_pairs-1))
-            pygame.draw.line(screen, self.color,
-                           (start_x, self.y),
-                           (start_x - leg_length * math.cos(angle_offset),
-                            self.y + leg_length * math.sin(angle_offset)), 2)
+            start_x = x - body_width//2 + (i * body_width//(leg_pairs-1))
+            pygame.draw.line(surface, color,
+                           (start_x, y),
+                           (start_x - leg_length * cos_offset,
+                            y + leg_length * sin_offset), 2)
             
             # Right leg
-            pygame.draw.line(screen, self.color,
-                           (start_x, self.y),
-                           (start_x + leg_length * math.cos(angle_offset),
-                            self.y + leg_length * math.sin(angle_offset)), 2)
-
-    def draw_antennae(self, screen: pygame.Surface):
+            pygame.draw.line(surface, color,
+                           (start_x, y),
+                           (start_x + leg_length * cos_offset,
+                            y + leg_length * sin_offset), 2)
+
+    @staticmethod
+    def draw_antennae(surface: pygame.Surface, x: float, y: float,
+                      color: Tuple[int, int, int], animation_frame: int):
         """Draws ant antennae"""
         antenna_length = 12
         antenna_segments = 3
         
         for i in range(2):
-            start_x = self.x - 5 + i * 10
+            start_x = x - 5 + i * 10
             current_x = start_x
-            current_y = self.y - 5
+            current_y = y - 5
             
             for j in range(antenna_segments):
-                angle = math.sin(self.animation_frame * 0.2 + i) * 0.3
-                end_x = current_x + antenna_length/antenna_segments * math.cos(angle)
-                end_y = current_y - antenna_length/antenna_segments * math.sin(angle)
+                end_x = current_x + antenna_length/antenna_segments * ANTENNA_COS[animation_frame][i]
+                end_y = current_y - antenna_length/antenna_segments * ANTENNA_SIN[animation_frame][i]
                 
-                pygame.draw.line(screen, self.color,
+                pygame.draw.line(surface, color,
                                (current_x, current_y),
                                (end_x, end_y), 1)
                 
                 current_x = end_x
                 current_y = end_y
 
-    def draw_eyes(self, screen: pygame.Surface, color: Tuple[int, int, int]):
+    @staticmethod
+    def draw_eyes(surface: pygame.Surface, x: float, y: float, color: Tuple[int, int, int]):
         """Draws ant eyes"""
         eye_radius = 2
         eye_spacing = 6
         
-        pygame.draw.circle(screen, color,
-                         (int(self.x - eye_spacing//2), int(self.y - 2)),
+        pygame.draw.circle(surface, color,
+                         (int(x - eye_spacing//2), int(y - 2)),
                          eye_radius)
-        pygame.draw.circle(screen, color,
-                         (int(self.x + eye_spacing//2), int(self.y - 2)),
+        pygame.draw.circle(surface, color,
+                         (int(x + eye_spacing//2), int(y - 2)),
                          eye_radius)
         
-    def draw_health_bar(self, screen: pygame.Surface):
+    def draw_health_bar(self, screen: pygame.Surface) -> pygame.Rect:
         """Draws health bar above ant"""
         bar_width = 30
         bar_height = 4
         bar_pos = (int(self.x - bar_width/2), int(self.y - 20))
         
         # Background (red)
-        pygame.draw.rect(screen, Colors.RED,
-                        (*bar_pos, bar_width, bar_height))
+        rect = pygame.draw.rect(screen, Colors.RED,
+                               (*bar_pos, bar_width, bar_height))
         # Health (green)
         health_width = bar_width * (self.health / self.max_health)
         pygame.draw.rect(screen, Colors.GREEN,
                         (*bar_pos, health_width, bar_height))
+        return rect
 
-    def draw_ability_cooldowns(self, screen: pygame.Surface):
+    def draw_ability_cooldowns(self, screen: pygame.Surface) -> pygame.Rect:
         """Draws cooldown indicators for abilities"""
         indicator_size = 5
         spacing = 8
         y_pos = self.y + 15
         
-        for i, (name, ability) in enumerate(self.abilities.items()):
-            x_pos = self.x - len(self.abilities) * spacing/2 + i * spacing
+        rects = []
+        for i, ability in enumerate(self._ability_list):
+            x_pos = self.x - len(self._ability_list) * spacing/2 + i * spacing
             color = Colors.GREEN if ability.current_cooldown <= 0 else Colors.RED
-            pygame.draw.circle(screen, color, (int(x_pos), int(y_pos)), indicator_size)
+            rects.append(pygame.draw.circle(screen, color, (int(x_pos), int(y_pos)), indicator_size))
+        return rects[0].unionall(rects[1:])
 
     def take_damage(self, amount: int):
         """Handles damage taken by the ant"""
@@ -414,10 +622,10 @@ class Ant:
         if effect_type == "acid":
             self.active_effects.append(AcidEffect(duration))
 
-    def use_ability(self, ability_name: str, target) -> bool:
+    def use_ability(self, ability_name: str, target, d2: Optional[float] = None) -> bool:
         """Attempts to use the named ability"""
         if ability_name in self.abilities:
-            return self.abilities[ability_name].activate(self, target)
+            return self.abilities[ability_name].activate(self, target, d2)
         return False
 
 class AIController:
@@ -429,11 +637,8 @@ class AIController:
         self.target = None
         self.difficulty = 0.7  # 0 to 1, higher is more difficult
 
-    def update(self, dt: float, player_ant: Ant, terrain: Terrain):
+    def update(self, dt: float, player_ant: Ant, terrain: Terrain, d2: Optional[float] = None):
         """Updates AI behavior"""
-        if not self.ant.is_alive:
-            return
-
         self.state_timer -= dt
         distance_to_player = abs(self.ant.x - player_ant.x)
 
@@ -462,9 +667,9 @@ class AIController:
             if distance_to_player < 120 and random.random() < self.difficulty:
                 # Choose and use an ability
                 if distance_to_player < 40 and random.random() < 0.7:
-                    self.ant.use_ability('bite', player_ant)
+                    self.ant.bite.activate(self.ant, player_ant, d2)
                 else:
-                    self.ant.use_ability('acid_spray', player_ant)
+                    self.ant.acid.activate(self.ant, player_ant, d2)
             
             self.state = "idle"
             self.state_timer = random.uniform(1.0, 2.0)
@@ -481,17 +686,24 @@ class Game:
         self.terrain = Terrain(self.config)
         
         # Game objects
-        self.player = Ant(100, self.config.SCREEN_HEIGHT - 150)
+        self.ants = AntPool()
+        self.player = Ant(100, self.config.SCREEN_HEIGHT - 150, pool=self.ants)
         self.enemy = Ant(self.config.SCREEN_WIDTH - 150, 
                         self.config.SCREEN_HEIGHT - 150,
-                        Colors.BLUE, True)
+                        Colors.BLUE, True, pool=self.ants)
         self.ai_controller = AIController(self.enemy, self.config)
+        # Ants that still get per-frame update and draw calls
+        self._alive_entities: List[Ant] = [self.player, self.enemy]
         
         self.projectile = None
         self.charging_power = 0
         
         # UI elements
         self.font = pygame.font.Font(None, 36)
+        
+        # Screen areas drawn over last frame, restored from the terrain before redrawing
+        self._dirty: List[pygame.Rect] = []
+        self._full_redraw = True
 
     def handle_menu(self):
         """Handles menu state"""
@@ -501,6 +713,7 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     self.state = GameState.PLAYING
+                    self._full_redraw = True
                 elif event.key == pygame.K_ESCAPE:
                     return False
         
@@ -555,6 +768,8 @@ class Game:
     def handle_input(self):
         """Handles player input during gameplay"""
         keys = pygame.key.get_pressed()
+        bite_pressed = keys[pygame.K_z]
+        acid_pressed = keys[pygame.K_x]
         
         # Movement
         if keys[pygame.K_LEFT]:
@@ -569,10 +784,14 @@ class Game:
             self.player.walking = False
             
         # Abilities
-        if keys[pygame.K_z]:
-            self.player.use_ability('bite', self.enemy)
-        if keys[pygame.K_x]:
-            self.player.use_ability('acid_spray', self.enemy)
+        if bite_pressed or acid_pressed:
+            dx = self.player.x - self.enemy.x
+            dy = self.player.y - self.enemy.y
+            d2 = dx * dx + dy * dy
+            if bite_pressed:
+                self.player.bite.activate(self.player, self.enemy, d2)
+            if acid_pressed:
+                self.player.acid.activate(self.player, self.enemy, d2)
             
         # Charging power
         if keys[pygame.K_SPACE]:
@@ -583,10 +802,18 @@ class Game:
 
     def update(self, dt: float):
         """Updates game state"""
-        # Update entities
-        self.player.update(dt, self.terrain)
-        self.enemy.update(dt, self.terrain)
-        self.ai_controller.update(dt, self.player, self.terrain)
+        # Update entities, with all ant physics stepped in one vectorized pass
+        self.ants.step(self.terrain)
+        for ant in self._alive_entities:
+            ant.update(dt)
+        self._refresh_alive()
+        
+        # Shared player/enemy squared distance for this frame's ability checks
+        dx = self.player.x - self.enemy.x
+        dy = self.player.y - self.enemy.y
+        d2 = dx * dx + dy * dy
+        if self.enemy.is_alive:
+            self.ai_controller.update(dt, self.player, self.terrain, d2)
         
         if self.projectile and self.projectile.active:
             self.projectile.update(self.config)
@@ -598,46 +825,59 @@ class Game:
                 self.projectile.active = False
             
             # Check hit on enemy
-            distance = math.hypot(self.projectile.x - self.enemy.x,
-                                self.projectile.y - self.enemy.y)
-            if distance < 15:
+            dx = self.projectile.x - self.enemy.x
+            dy = self.projectile.y - self.enemy.y
+            if dx * dx + dy * dy < 15 * 15:
                 self.enemy.take_damage(self.projectile.damage)
                 self.projectile.active = False
         
+        self._refresh_alive()
+        
         # Check win/lose conditions
         if not self.player.is_alive or not self.enemy.is_alive:
             self.state = GameState.GAME_OVER
 
+    def _refresh_alive(self):
+        """Drops ants that died this frame from the per-frame update and draw list"""
+        if self.ants.alive_changed:
+            self.ants.alive_changed = False
+            self._alive_entities = [ant for ant in self._alive_entities if ant.is_alive]
+
     def draw(self):
-        """Renders the game state"""
-        self.screen.fill(Colors.WHITE)
-        
-        # Draw terrain
-        self.screen.blit(self.terrain.surface, (0, 0))
+        """Renders the game state, pushing only the changed areas to the display"""
+        # Draw sky and terrain, either in full or just where it was drawn over or damaged
+        restored = self._dirty + self.terrain.dirty_rects
+        self.terrain.dirty_rects.clear()
+        if self._full_redraw:
+            self.screen.blit(self.terrain.surface, (0, 0))
+        else:
+            for rect in restored:
+                self.screen.blit(self.terrain.surface, rect, rect)
         
         # Draw entities
-        self.player.draw(self.screen)
-        self.enemy.draw(self.screen)
+        drawn = [ant.draw(self.screen) for ant in self._alive_entities]
         if self.projectile and self.projectile.active:
-            self.projectile.draw(self.screen)
+            drawn.append(self.projectile.draw(self.screen))
         
         # Draw power meter when charging
         if self.charging_power > 0:
-            pygame.draw.rect(self.screen, Colors.RED,
-                           (10, 10, self.charging_power * 10, 20))
+            drawn.append(pygame.draw.rect(self.screen, Colors.RED,
+                                          (10, 10, self.charging_power * 10, 20)))
         
-        pygame.display.flip()
+        self._dirty = [rect for rect in drawn if rect is not None]
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(restored + self._dirty)
 
     def run(self):
         """Main game loop"""
         running = True
-        last_time = time.time()
         
         while running:
-            # Calculate delta time
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
+            # Cap the frame rate and take delta time from the same clock
+            dt = min(self.clock.tick(self.config.FPS) / 1000.0, self.config.MAX_FRAME_TIME)
             
             # Handle game states
             if self.state == GameState.MENU:
@@ -649,22 +889,20 @@ class Game:
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
                         running = False
+                    elif event.type == pygame.WINDOWEXPOSED:
+                        self._full_redraw = True
                     elif event.type == pygame.KEYUP:
                         if event.key == pygame.K_SPACE and self.charging_power > 0:
                             # Launch projectile
                             angle = math.radians(45)
-                            velocity = [
-                                self.charging_power * math.cos(angle),
-                                -self.charging_power * math.sin(angle)
-                            ]
-                            self.projectile = Projectile(self.player.x, self.player.y, velocity)
+                            self.projectile = Projectile(float(self.player.x), float(self.player.y),
+                                                         self.charging_power * math.cos(angle),
+                                                         -self.charging_power * math.sin(angle))
                             self.charging_power = 0
                 
                 self.handle_input()
                 self.update(dt)
                 self.draw()
-            
-            self.clock.tick(self.config.FPS)
 
         pygame.quit()
         sys.exit()